@@ -2,19 +2,38 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Iterable, TypeVar
+from typing import Any, Callable, Iterable
 
+import orjson
 import requests
+from singer_sdk import metrics
 from singer_sdk.authenticators import BearerTokenAuthenticator
 from singer_sdk.helpers._typing import TypeConformanceLevel
-from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.streams import RESTStream
 
 _Auth = Callable[[requests.PreparedRequest], requests.PreparedRequest]
-SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
+SCHEMAS_DIR = Path(__file__).parent / "schemas"
 
-_TToken = TypeVar("_TToken")
+
+def decode_json(response: requests.Response) -> Any:
+    """Return the decoded JSON body of a response, decoding it only once.
+
+    The paginator and ``parse_response`` both read the body, so the decoded
+    value is cached on the response object.
+
+    Args:
+        response: The HTTP ``requests.Response`` object.
+
+    Returns:
+        The decoded response body.
+    """
+    parsed = getattr(response, "_parsed", None)
+    if parsed is None:
+        parsed = orjson.loads(response.content)
+        response._parsed = parsed  # type: ignore[attr-defined]
+    return parsed
 
 
 class prefectStream(RESTStream):
@@ -26,6 +45,29 @@ class prefectStream(RESTStream):
     rest_method = "POST"
     PAGE_SIZE = 100
     TYPE_CONFORMANCE_LEVEL = TypeConformanceLevel.ROOT_ONLY
+    # Endpoint path, filled in once per stream with the configured ids. Every
+    # concrete stream must set it.
+    path_template = ""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the stream and resolve the API endpoint path once.
+
+        Args:
+            *args: Arguments to pass to ``RESTStream``.
+            **kwargs: Keyword arguments to pass to ``RESTStream``.
+
+        Raises:
+            TypeError: If the stream does not define ``path_template``.
+        """
+        super().__init__(*args, **kwargs)
+        if not self.path_template:
+            raise TypeError(f"{type(self).__name__} must define path_template.")
+        # Fail fast on missing ids rather than on the first request.
+        self._account_id = self.config["account_id"]
+        self._workspace_id = self.config["workspace_id"]
+        self.path = self.path_template.format_map(
+            {"account_id": self._account_id, "workspace_id": self._workspace_id}
+        )
 
     # OR use a dynamic url_base:
     @property
@@ -37,7 +79,6 @@ class prefectStream(RESTStream):
         """
         return self.config["api_url"]
 
-    records_jsonpath = "$[*]"  # Or override `parse_response`.
     # next_page_token_jsonpath = "$.offset"  # Or override `get_next_page_token`.
 
     @property
@@ -83,7 +124,7 @@ class prefectStream(RESTStream):
         """
         previous_token = previous_token or 0
 
-        if len(response.json()) == 0:
+        if len(decode_json(response)) == 0:
             return None
 
         return previous_token + self.PAGE_SIZE
@@ -130,17 +171,106 @@ class prefectStream(RESTStream):
         # TODO: Delete this method if no payload is required. (Most REST APIs.)
         return None
 
+    def build_prepared_request(
+        self, *args: Any, **kwargs: Any
+    ) -> requests.PreparedRequest:
+        """Build an authenticated request, serializing any JSON body with orjson.
+
+        Args:
+            *args: Arguments to pass to ``requests.Request``.
+            **kwargs: Keyword arguments to pass to ``requests.Request``.
+
+        Returns:
+            A ``requests.PreparedRequest`` object.
+        """
+        payload = kwargs.pop("json", None)
+        if payload is not None:
+            kwargs["data"] = orjson.dumps(payload)
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "Content-Type": "application/json",
+            }
+        return super().build_prepared_request(*args, **kwargs)
+
+    def request_records(self, context: dict | None) -> Iterable[dict]:
+        """Request records from REST endpoint(s), returning response records.
+
+        The request for the next page is sent from a background thread while the
+        records of the current page are parsed and emitted. An error on that
+        prefetched page, or from advancing the paginator, is raised once the
+        current page's records are yielded.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Yields:
+            An item for every record in the response.
+
+        Raises:
+            advance_error: Any error from the paginator, after the page's records.
+        """
+        paginator = self.get_new_paginator()
+        decorated_request = self.request_decorator(self._request)
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        try:
+            with metrics.http_request_counter(self.name, self.path) as request_counter:
+                request_counter.context = context
+
+                prepared_request = self.prepare_request(
+                    context, next_page_token=paginator.current_value
+                )
+                pending: Future[Any] | None = executor.submit(
+                    decorated_request, prepared_request, context
+                )
+
+                while pending is not None:
+                    resp = pending.result()
+                    request_counter.increment()
+                    self.update_sync_costs(prepared_request, resp, context)
+
+                    # Like a prefetch error, a pagination error (e.g. a detected
+                    # loop) is raised only after this page's records are yielded.
+                    advance_error: Exception | None = None
+                    try:
+                        paginator.advance(resp)
+                    except Exception as exc:
+                        advance_error = exc
+
+                    pending = None
+                    if advance_error is None and not paginator.finished:
+                        prepared_request = self.prepare_request(
+                            context, next_page_token=paginator.current_value
+                        )
+                        pending = executor.submit(
+                            decorated_request, prepared_request, context
+                        )
+
+                    yield from self.parse_response(resp)
+                    if advance_error is not None:
+                        raise advance_error
+        finally:
+            # If the consumer closes the generator early, don't block on an
+            # in-flight prefetch; it finishes in the background and is dropped.
+            executor.shutdown(wait=False)
+
     def parse_response(self, response: requests.Response) -> Iterable[dict]:
         """Parse the response and return an iterator of result records.
 
+        The Prefect filter endpoints return the records as a top-level array. A
+        single object body is yielded as one record, as ``$[*]`` would.
+
         Args:
             response: The HTTP ``requests.Response`` object.
 
         Yields:
             Each record from the source.
         """
-        # TODO: Parse response body and return a set of records.
-        yield from extract_jsonpath(self.records_jsonpath, input=response.json())
+        body = decode_json(response)
+        if isinstance(body, dict):
+            yield body
+        else:
+            yield from body
 
     def post_process(self, row: dict, context: dict | None = None) -> dict | None:
         """As needed, append or transform raw data to match expected structure.
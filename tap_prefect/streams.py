@@ -2,34 +2,30 @@
 
 from __future__ import annotations
 
-import logging
-from pathlib import Path
-from typing import Any, Dict, Iterable, Optional, TypeVar
+from typing import Any, Iterable
 
 import requests
-from singer_sdk import metrics
-from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.pagination import BaseHATEOASPaginator, SinglePagePaginator
 
-from tap_prefect.client import prefectStream
-
-LOGGER = logging.getLogger(__name__)
-
-SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
-
-_TToken = TypeVar("_TToken")
+from tap_prefect.client import SCHEMAS_DIR, decode_json, prefectStream
 
 
 class MyHATEOASPaginator(BaseHATEOASPaginator):
     """Custom paginator."""
 
     def get_next_url(self, response):
-        next_page = response.json().get("next_page")
+        # Prefer an RFC 8288 ``Link: <...>; rel="next"`` header when the server sends
+        # one. Otherwise fall back to the body, which parse_response decodes anyway.
+        next_link = response.links.get("next", {}).get("url")
+        if next_link:
+            return next_link
+
+        next_page = decode_json(response).get("next_page")
 
         # Incredibly ugly hack to aviod what has to be a bug in the API: It seems the final page returns a
         # next_page URL that is invalid and returns a 500. This URL is much shorter than the normal ones, so we are
         # checking for this here.
-        if len(next_page) < 400:
+        if not next_page or len(next_page) < 400:
             return None
         return next_page
 
@@ -55,21 +51,32 @@ class FlowRunStream(prefectStream):
     name = "flow_runs"
     rest_method = "POST"
 
-    @property
-    def path(self):
-        """Return the API endpoint path.
+    path_template = "/accounts/{account_id}/workspaces/{workspace_id}/flow_runs/filter"
 
-        Returns:
-            The API endpoint path.
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the stream and build the payload template once.
+
+        Args:
+            *args: Arguments to pass to ``prefectStream``.
+            **kwargs: Keyword arguments to pass to ``prefectStream``.
         """
-        return f"/accounts/{self.config['account_id']}/workspaces/{self.config['workspace_id']}/flow_runs/filter"
+        super().__init__(*args, **kwargs)
+        starting_date = (
+            self.config.get("start_date") or "2021-01-01T00:00:00.000000+00:00"
+        )
+        # Only the offset changes between pages; the nested filter is shared.
+        self._payload_template = {
+            "sort": "EXPECTED_START_TIME_ASC",
+            "limit": self.PAGE_SIZE,
+            "flow_runs": {"expected_start_time": {"after_": starting_date}},
+        }
 
     primary_keys = ["id"]
     # replication_key = "expected_start_time"
     schema_filepath = SCHEMAS_DIR / "flow_runs.json"
 
     def prepare_request_payload(
-        self, context: dict | None, next_page_token: _TToken | None
+        self, context: dict | None, next_page_token: Any | None
     ) -> dict | None:
         """Prepare the data payload for the REST API request.
 
@@ -81,18 +88,7 @@ class FlowRunStream(prefectStream):
         Returns:
             Dictionary with the body to use for the request.
         """
-        starting_date = (
-            self.config.get("start_date") or "2021-01-01T00:00:00.000000+00:00"
-        )
-
-        params = {
-            "sort": "EXPECTED_START_TIME_ASC",
-            "offset": next_page_token,
-            "limit": self.PAGE_SIZE,
-            "flow_runs": {"expected_start_time": {"after_": starting_date}},
-        }
-
-        return params
+        return {**self._payload_template, "offset": next_page_token}
 
     # def get_child_context(self, record: dict, context: Optional[dict]) -> dict:
     #     """Return a context dictionary for child streams."""
@@ -118,12 +114,12 @@ class FlowRunStream(prefectStream):
 #         """Return the partition for the stream."""
 #         return []
 
-#     @property
-#     def path(self):
-#         return f"/accounts/{self.config['account_id']}/workspaces/{self.config['workspace_id']}/task_runs/filter"
+#     path_template = (
+#         "/accounts/{account_id}/workspaces/{workspace_id}/task_runs/filter"
+#     )
 
 #     def prepare_request_payload(
-#         self, context: dict | None, next_page_token: _TToken | None
+#         self, context: dict | None, next_page_token: Any | None
 #     ) -> dict | None:
 #         """Prepare the data payload for the REST API request.
 
@@ -154,7 +150,6 @@ class FlowRunStream(prefectStream):
 class FlowsStream(prefectStream):
     name = "flows"
     rest_method = "POST"
-    records_jsonpath = "$.[*]"
     primary_keys = ["id"]
 
     schema_filepath = SCHEMAS_DIR / "flows.json"
@@ -167,17 +162,10 @@ class FlowsStream(prefectStream):
         """
         return MySinglePagePaginator()
 
-    @property
-    def path(self):
-        """Return the API endpoint path.
-
-        Returns:
-            The API endpoint path.
-        """
-        return f"/accounts/{self.config['account_id']}/workspaces/{self.config['workspace_id']}/flows/filter"
+    path_template = "/accounts/{account_id}/workspaces/{workspace_id}/flows/filter"
 
     def prepare_request_payload(
-        self, context: dict | None, next_page_token: _TToken | None
+        self, context: dict | None, next_page_token: Any | None
     ) -> dict | None:
         """Prepare the data payload for the REST API request.
 
@@ -196,7 +184,6 @@ class DeploymentsStream(prefectStream):
     name = "deployments"
     rest_method = "POST"
     primary_keys = ["id"]
-    records_jsonpath = "$.[*]"
     schema_filepath = SCHEMAS_DIR / "deployments.json"
 
     def get_new_paginator(self):
@@ -207,17 +194,12 @@ class DeploymentsStream(prefectStream):
         """
         return MySinglePagePaginator()
 
-    @property
-    def path(self):
-        """Return the API endpoint path.
-
-        Returns:
-            The API endpoint path.
-        """
-        return f"/accounts/{self.config['account_id']}/workspaces/{self.config['workspace_id']}/deployments/filter"
+    path_template = (
+        "/accounts/{account_id}/workspaces/{workspace_id}/deployments/filter"
+    )
 
     def prepare_request_payload(
-        self, context: dict | None, next_page_token: _TToken | None
+        self, context: dict | None, next_page_token: Any | None
     ) -> dict | None:
         """Prepare the data payload for the REST API request.
 
@@ -238,20 +220,11 @@ class EventStream(prefectStream):
 
     name = "events"
     rest_method = "POST"
-    records_jsonpath = "$.events[*]"
-
-    primary_keys = ["id"]
-    replication_key = None
-    schema_filepath = SCHEMAS_DIR / "events.json"
-
-    @property
-    def path(self):
-        """Return the API endpoint path.
+    # The events filter endpoint rejects limits above 50; later pages follow
+    # the server-issued next_page URL and reuse this size.
+    PAGE_SIZE = 50
 
-        Returns:
-            The API endpoint path.
-        """
-        return f"/accounts/{self.config['account_id']}/workspaces/{self.config['workspace_id']}/events/filter"
+    path_template = "/accounts/{account_id}/workspaces/{workspace_id}/events/filter"
 
     primary_keys = ["id"]
     replication_key = "occurred"
@@ -266,23 +239,8 @@ class EventStream(prefectStream):
         """
         return MyHATEOASPaginator()
 
-    def get_url_params(
-        self, context: Optional[dict], next_page_token: Optional[Any]
-    ) -> Dict[str, Any]:
-        """Return next page link or None.
-
-        Args:
-            context: Comtext.
-            next_page_token: The HTTP response object.
-
-        Returns:
-            The next page link or None.
-        """
-
-        return {}
-
     def prepare_request_payload(
-        self, context: dict | None, next_page_token: _TToken | None
+        self, context: dict | None, next_page_token: Any | None
     ) -> dict | None:
         """Prepare the data payload for the REST API request.
 
@@ -294,6 +252,9 @@ class EventStream(prefectStream):
         Returns:
             Dictionary with the body to use for the request.
         """
+        # Later pages are plain GETs against the next_page URL and carry no body.
+        if next_page_token:
+            return None
 
         starting_date = self.get_starting_replication_key_value(
             context
@@ -301,8 +262,8 @@ class EventStream(prefectStream):
             "start_date"
         )  # "2019-08-24T14:15:22Z"
 
-        params = {
-            "limit": 50,
+        return {
+            "limit": self.PAGE_SIZE,
             "filter": {
                 "occurred": {"since": starting_date},
                 "event": {"exclude_name": ["prefect.log.write"]},
@@ -310,11 +271,6 @@ class EventStream(prefectStream):
             },
         }
 
-        if next_page_token:
-            return None
-
-        return params
-
     def parse_response(self, response: requests.Response) -> Iterable[dict]:
         """Parse the response and return an iterator of result records.
 
@@ -325,34 +281,7 @@ class EventStream(prefectStream):
             A stream record.
         """
 
-        yield from extract_jsonpath(self.records_jsonpath, input=response.json())
-
-    def request_records(self, context: dict | None) -> Iterable[dict]:
-        """Request records from REST endpoint(s), returning response records.
-
-        Args:
-            context: Stream partition or context dictionary.
-
-        Yields:
-            A stream record.
-        """
-        paginator = self.get_new_paginator()
-        decorated_request = self.request_decorator(self._request)
-
-        with metrics.http_request_counter(self.name, self.path) as request_counter:
-            request_counter.context = context
-
-            while not paginator.finished:
-                prepared_request = self.prepare_request(
-                    context, next_page_token=paginator.current_value
-                )
-
-                resp = decorated_request(prepared_request, context)
-                request_counter.increment()
-                self.update_sync_costs(prepared_request, resp, context)
-                yield from self.parse_response(resp)
-
-                paginator.advance(resp)
+        yield from decode_json(response).get("events", ())
 
     def prepare_request(
         self, context: dict | None, next_page_token
@@ -4,9 +4,12 @@ import responses
 from responses import POST, GET
 import pytest
 import subprocess
+from tap_prefect.client import prefectStream
 from tap_prefect.tap import Tapprefect
 import json
 import re
+import threading
+from singer_sdk.exceptions import FatalAPIError
 
 SAMPLE_CONFIG = {
     "start_date": "2023-05-18T00:00:00Z",
@@ -133,3 +136,177 @@ def test_events(capsys):
 
 
 
+
+
+@responses.activate
+def test_flow_runs_payload():
+
+    tap = Tapprefect(config=SAMPLE_CONFIG)
+
+    responses.add(POST, BASE_URL + "flow_runs/filter", json=flow_runs_response(), status=200)
+    responses.add(POST, BASE_URL + "flow_runs/filter", json=[], status=200)
+
+    _ = tap.streams['flow_runs'].sync(None)
+
+    first, second = [json.loads(call.request.body) for call in responses.calls]
+    assert responses.calls[0].request.headers['Content-Type'] == 'application/json'
+    assert first['offset'] is None
+    assert second['offset'] == 100
+    assert first['flow_runs'] == second['flow_runs'] == {
+        "expected_start_time": {"after_": SAMPLE_CONFIG['start_date']}
+    }
+
+
+@responses.activate
+def test_events_payload():
+
+    tap = Tapprefect(config=SAMPLE_CONFIG)
+
+    events_1, events_2 = events_response()
+
+    responses.add(POST, BASE_URL + "events/filter", json=events_1, status=200)
+
+    responses.add_callback(
+    GET,
+    re.compile(r'https://api.prefect.cloud/api/accounts/123/workspaces/456/events/filter/next'),
+    callback=lambda _: (200, {}, json.dumps(events_2)),
+    )
+
+    _ = tap.streams['events'].sync(None)
+
+    first, second = responses.calls
+    assert json.loads(first.request.body) == {
+        "limit": 50,
+        "filter": {
+            "occurred": {"since": SAMPLE_CONFIG['start_date']},
+            "event": {"exclude_name": ["prefect.log.write"]},
+            "order": "ASC",
+        },
+    }
+    assert second.request.method == 'GET'
+    assert second.request.body is None
+
+
+@responses.activate
+def test_events_link_header(capsys):
+
+    tap = Tapprefect(config=SAMPLE_CONFIG)
+
+    events_1, events_2 = events_response()
+    events_1 = {**events_1, "next_page": None}
+    next_link = BASE_URL + "events/filter/next?page-token=abc"
+
+    responses.add(POST, BASE_URL + "events/filter", json=events_1, status=200,
+                  headers={"Link": f'<{next_link}>; rel="next"'})
+    responses.add(GET, next_link, json=events_2, status=200)
+
+    _ = tap.streams['events'].sync(None)
+
+    assert [call.request.url for call in responses.calls] == [BASE_URL + "events/filter", next_link]
+    stdout_parts = capsys.readouterr().out.strip().split('\n')
+    assert len(stdout_parts) == 6
+
+
+@pytest.mark.parametrize("missing", [True, False])
+@responses.activate
+def test_events_missing_next_page(capsys, missing):
+
+    tap = Tapprefect(config=SAMPLE_CONFIG)
+
+    events_1, _ = events_response()
+    if missing:
+        del events_1["next_page"]
+    else:
+        events_1["next_page"] = None
+
+    responses.add(POST, BASE_URL + "events/filter", json=events_1, status=200)
+
+    _ = tap.streams['events'].sync(None)
+
+    assert len(responses.calls) == 1
+    stdout_parts = capsys.readouterr().out.strip().split('\n')
+    assert len(stdout_parts) == 4
+
+
+@responses.activate
+def test_next_page_prefetched():
+
+    tap = Tapprefect(config=SAMPLE_CONFIG)
+    page_2_requested = threading.Event()
+
+    def page_2(_):
+        page_2_requested.set()
+        return 200, {}, json.dumps([])
+
+    responses.add(POST, BASE_URL + "flow_runs/filter", json=flow_runs_response(), status=200)
+    responses.add_callback(POST, BASE_URL + "flow_runs/filter", callback=page_2)
+
+    records = tap.streams['flow_runs'].request_records(None)
+    first = next(records)
+
+    # Page 2 is in flight while page 1's records are still being consumed.
+    assert page_2_requested.wait(timeout=5)
+    assert [first, *records] == flow_runs_response()
+
+
+@responses.activate
+def test_prefetch_error_raised_after_current_page():
+
+    tap = Tapprefect(config=SAMPLE_CONFIG)
+
+    responses.add(POST, BASE_URL + "flow_runs/filter", json=flow_runs_response(), status=200)
+    responses.add(POST, BASE_URL + "flow_runs/filter", json={}, status=404)
+
+    records = []
+    with pytest.raises(FatalAPIError):
+        for record in tap.streams['flow_runs'].request_records(None):
+            records.append(record)
+
+    assert records == flow_runs_response()
+
+
+@responses.activate
+def test_pagination_error_raised_after_current_page():
+
+    tap = Tapprefect(config=SAMPLE_CONFIG)
+
+    events_1, _ = events_response()
+    responses.add(POST, BASE_URL + "events/filter", json=events_1, status=200)
+
+    stream = tap.streams['events']
+    paginator = stream.get_new_paginator()
+
+    def advance(_):
+        raise RuntimeError("Loop detected in pagination.")
+
+    paginator.advance = advance
+    stream.get_new_paginator = lambda: paginator
+
+    records = []
+    with pytest.raises(RuntimeError, match="Loop detected"):
+        for record in stream.request_records(None):
+            records.append(record)
+
+    assert records == events_1["events"]
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_object_body_is_one_record():
+
+    tap = Tapprefect(config=SAMPLE_CONFIG)
+    flow = flows_response()[0]
+
+    responses.add(POST, BASE_URL + "flows/filter", json=flow, status=200)
+
+    assert list(tap.streams['flows'].request_records(None)) == [flow]
+
+
+def test_stream_without_path_template():
+
+    class NoPathStream(prefectStream):
+        name = "no_path"
+        schema = {"properties": {}}
+
+    with pytest.raises(TypeError, match="path_template"):
+        NoPathStream(Tapprefect(config=SAMPLE_CONFIG))